@@ -1,5 +1,6 @@
 # Run the SC2 Co-op overlay from repo root.
 # Usage: .\run.ps1
+# Needs PySide6, numpy and the WinRT OCR wheels; scipy/numba are optional (see README).
 
 $ErrorActionPreference = "Stop"
 
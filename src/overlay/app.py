@@ -4,8 +4,9 @@ import ctypes
 import ctypes.wintypes as wt
 import json
 import sys
+import threading
 
-from PySide6.QtCore import QAbstractNativeEventFilter
+from PySide6.QtCore import QObject, Qt, Signal
 from PySide6.QtWidgets import QApplication
 
 from overlay.config import OverlayConfig
@@ -13,10 +14,14 @@ from overlay.screen_clock import Rect, ScreenClock
 from overlay.ui.main_window import MainWindow
 
 user32 = ctypes.windll.user32
+kernel32 = ctypes.windll.kernel32
 
 MOD_CONTROL = 0x0002
 MOD_SHIFT = 0x0004
 WM_HOTKEY = 0x0312
+VK_Q = 0x51
+
+HWND_MESSAGE = -3
 
 # Calibration / debug hotkeys (global, while overlay runs)
 MOD_NONE = 0x0000
@@ -25,12 +30,22 @@ VK_F8 = 0x77
 VK_F9 = 0x78
 VK_F10 = 0x79
 
+HOTKEY_STOP_ID = 0  # posted by HotkeyThreadWin.stop(); never registered
 HOTKEY_QUIT_ID = 1
 HOTKEY_CALIBRATE_ID = 2
 HOTKEY_POINT_A_ID = 3
 HOTKEY_POINT_B_ID = 4
 HOTKEY_DEBUG_SNAPSHOT_ID = 5
 
+# (id, modifiers, virtual key, description)
+HOTKEYS = (
+    (HOTKEY_QUIT_ID, MOD_CONTROL | MOD_SHIFT, VK_Q, "Ctrl+Shift+Q"),
+    (HOTKEY_CALIBRATE_ID, MOD_NONE, VK_F7, "F7"),
+    (HOTKEY_POINT_A_ID, MOD_NONE, VK_F8, "F8"),
+    (HOTKEY_POINT_B_ID, MOD_NONE, VK_F9, "F9"),
+    (HOTKEY_DEBUG_SNAPSHOT_ID, MOD_NONE, VK_F10, "F10"),
+)
+
 
 class MSG(ctypes.Structure):
     _fields_ = [
@@ -51,23 +66,86 @@ def _cursor_pos() -> tuple[int, int]:
     return int(pt.x), int(pt.y)
 
 
-class HotkeyFilterWin(QAbstractNativeEventFilter):
-    def __init__(self, app: QApplication, on_hotkey) -> None:
-        super().__init__()
-        self._app = app
-        self._on_hotkey = on_hotkey
+user32.CreateWindowExW.argtypes = [
+    wt.DWORD, wt.LPCWSTR, wt.LPCWSTR, wt.DWORD,
+    ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+    wt.HWND, wt.HMENU, wt.HINSTANCE, wt.LPVOID,
+]
+user32.CreateWindowExW.restype = wt.HWND
+user32.DestroyWindow.argtypes = [wt.HWND]
+user32.RegisterHotKey.argtypes = [wt.HWND, ctypes.c_int, wt.UINT, wt.UINT]
+user32.UnregisterHotKey.argtypes = [wt.HWND, ctypes.c_int]
+user32.GetMessageW.argtypes = [ctypes.POINTER(MSG), wt.HWND, wt.UINT, wt.UINT]
+user32.GetMessageW.restype = wt.BOOL
+user32.PostThreadMessageW.argtypes = [wt.DWORD, wt.UINT, wt.WPARAM, wt.LPARAM]
 
-    def nativeEventFilter(self, event_type, message):  # type: ignore[override]
-        if event_type != "windows_generic_MSG":
-            return False, 0
 
-        msg = ctypes.cast(int(message), ctypes.POINTER(MSG)).contents
-        if msg.message == WM_HOTKEY:
-            hotkey_id = int(msg.wParam)
-            self._on_hotkey(hotkey_id)
-            return True, 0
+class HotkeyThreadWin(QObject):
+    """
+    Global hotkeys without touching Qt's event dispatch:
+    - A message-only window (HWND_MESSAGE) owns the RegisterHotKey registrations
+    - A daemon thread runs GetMessageW for that window only
+    - WM_HOTKEY ids are re-emitted as a Qt signal (queued onto the GUI thread)
+    """
 
-        return False, 0
+    hotkey = Signal(int)
+
+    def __init__(self, hotkeys) -> None:
+        super().__init__()
+        self._hotkeys = tuple(hotkeys)
+        self._thread: threading.Thread | None = None
+        self._thread_id = 0
+        self._ready = threading.Event()
+        self.failed: list[str] = []
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="HotkeysWin", daemon=True)
+        self._thread.start()
+        # Wait for registration so callers can report failures right away.
+        self._ready.wait(timeout=2.0)
+
+    def stop(self) -> None:
+        if self._thread_id:
+            # WM_QUIT would be filtered out by the WM_HOTKEY-only GetMessageW below.
+            user32.PostThreadMessageW(self._thread_id, WM_HOTKEY, HOTKEY_STOP_ID, 0)
+        t = self._thread
+        if t and t.is_alive():
+            t.join(timeout=1.0)
+
+    def _run(self) -> None:
+        # Hotkey messages are posted to the thread that created the window.
+        self._thread_id = kernel32.GetCurrentThreadId()
+        hwnd = user32.CreateWindowExW(0, "STATIC", None, 0, 0, 0, 0, 0, HWND_MESSAGE, None, None, None)
+        if not hwnd:
+            self.failed = [desc for _, _, _, desc in self._hotkeys]
+            self._ready.set()
+            return
+
+        registered: list[int] = []
+        try:
+            for hotkey_id, mods, vk, desc in self._hotkeys:
+                if user32.RegisterHotKey(hwnd, hotkey_id, mods, vk):
+                    registered.append(hotkey_id)
+                else:
+                    self.failed.append(desc)
+            self._ready.set()
+
+            # Let the kernel do the message-type filtering: GetMessageW only
+            # returns WM_HOTKEY, so Python never wakes up for anything else.
+            msg = MSG()
+            pmsg = ctypes.byref(msg)
+            get_message = user32.GetMessageW
+            emit = self.hotkey.emit
+            while get_message(pmsg, None, WM_HOTKEY, WM_HOTKEY) > 0:
+                hotkey_id = int(msg.wParam or 0)
+                if hotkey_id == HOTKEY_STOP_ID:
+                    break
+                emit(hotkey_id)
+        finally:
+            for hotkey_id in registered:
+                user32.UnregisterHotKey(hwnd, hotkey_id)
+            user32.DestroyWindow(hwnd)
+            self._ready.set()
 
 
 def _load_config_or_die() -> OverlayConfig:
@@ -90,16 +168,6 @@ def _save_config_rect(rect: Rect) -> None:
 def main() -> int:
     app = QApplication(sys.argv)
 
-    # Register global quit hotkey: Ctrl + Shift + Q
-    if not user32.RegisterHotKey(None, HOTKEY_QUIT_ID, MOD_CONTROL | MOD_SHIFT, 0x51):
-        print("WARNING: RegisterHotKey failed (Ctrl+Shift+Q).", flush=True)
-
-    # Register calibration/debug hotkeys globally (works even when SC2 focused)
-    user32.RegisterHotKey(None, HOTKEY_CALIBRATE_ID, MOD_NONE, VK_F7)
-    user32.RegisterHotKey(None, HOTKEY_POINT_A_ID, MOD_NONE, VK_F8)
-    user32.RegisterHotKey(None, HOTKEY_POINT_B_ID, MOD_NONE, VK_F9)
-    user32.RegisterHotKey(None, HOTKEY_DEBUG_SNAPSHOT_ID, MOD_NONE, VK_F10)
-
     calibrating = {"active": False, "ax": None, "ay": None, "bx": None, "by": None}
 
     clock: ScreenClock | None = None
@@ -111,11 +179,13 @@ def main() -> int:
             clock.stop()
             clock = None
 
-    def start_clock_from_config() -> None:
+    def start_clock_from_config(rect: Rect | None = None) -> None:
+        # Pass `rect` when it is already in hand (fresh calibration) to skip re-reading config.json.
         nonlocal clock
-        cfg = _load_config_or_die()
+        if rect is None:
+            rect = _load_config_or_die().clock_rect
         clock = ScreenClock(
-            rect=cfg.clock_rect,
+            rect=rect,
             poll_hz=10.0,
             game_speed_multiplier=1.4,
             time_offset_s=1,
@@ -146,6 +216,9 @@ def main() -> int:
                 f"rect={info.get('rect')}",
                 f"raw={info.get('raw_path')}",
             ]
+            error = info.get("error")
+            if error is not None:
+                lines.append(f"error={error}")
             if crop_path is not None:
                 lines.append(f"crop={crop_path}")
             if used_local_crop is not None:
@@ -164,7 +237,10 @@ def main() -> int:
             print("\n  ".join(lines), flush=True)
 
             if win is not None:
-                win.set_debug_text("F10: snapshot written to .debug (see console)")
+                if error is not None:
+                    win.set_debug_text(f"F10: {error}")
+                else:
+                    win.set_debug_text("F10: snapshot written to .debug (see console)")
             return
 
         if hotkey_id == HOTKEY_CALIBRATE_ID:
@@ -228,7 +304,7 @@ def main() -> int:
             _save_config_rect(rect)
 
             stop_clock()
-            start_clock_from_config()
+            start_clock_from_config(rect)
 
             calibrating["active"] = False
             msg = f"Saved config.json with clock_rect={rect}. Restarted clock."
@@ -237,8 +313,12 @@ def main() -> int:
                 win.set_debug_text(msg)
             return
 
-    hk_filter = HotkeyFilterWin(app, on_hotkey)
-    app.installNativeEventFilter(hk_filter)
+    # Register quit + calibration/debug hotkeys globally (works even when SC2 focused)
+    hotkeys = HotkeyThreadWin(HOTKEYS)
+    hotkeys.hotkey.connect(on_hotkey, Qt.ConnectionType.QueuedConnection)
+    hotkeys.start()
+    for desc in hotkeys.failed:
+        print(f"WARNING: RegisterHotKey failed ({desc}).", flush=True)
 
     start_clock_from_config()
 
@@ -251,11 +331,7 @@ def main() -> int:
         return app.exec()
     finally:
         stop_clock()
-        user32.UnregisterHotKey(None, HOTKEY_QUIT_ID)
-        user32.UnregisterHotKey(None, HOTKEY_CALIBRATE_ID)
-        user32.UnregisterHotKey(None, HOTKEY_POINT_A_ID)
-        user32.UnregisterHotKey(None, HOTKEY_POINT_B_ID)
-        user32.UnregisterHotKey(None, HOTKEY_DEBUG_SNAPSHOT_ID)
+        hotkeys.stop()
 
 
 if __name__ == "__main__":
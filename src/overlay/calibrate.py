@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import ctypes
+import ctypes.wintypes as wt
 import json
 import os
 import sys
-import time
 from dataclasses import dataclass
 
 user32 = ctypes.windll.user32
@@ -13,6 +13,18 @@ VK_F8 = 0x77
 VK_F9 = 0x78
 VK_ESCAPE = 0x1B
 
+MOD_NOREPEAT = 0x4000
+WM_HOTKEY = 0x0312
+QS_HOTKEY = 0x0080
+PM_REMOVE = 0x0001
+
+HOTKEY_A_ID = 1
+HOTKEY_B_ID = 2
+HOTKEY_QUIT_ID = 3
+
+# Wake at least this often to refresh the cursor readout.
+CURSOR_REFRESH_MS = 100
+
 
 class POINT(ctypes.Structure):
     _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
@@ -25,9 +37,32 @@ def _cursor_pos() -> tuple[int, int]:
     return int(pt.x), int(pt.y)
 
 
-def _key_down(vk: int) -> bool:
-    # High-order bit set means the key is currently down
-    return (user32.GetAsyncKeyState(vk) & 0x8000) != 0
+def _register_hotkeys() -> None:
+    # Thread-level hotkeys (hwnd=None): WM_HOTKEY lands in this thread's queue.
+    # MOD_NOREPEAT replaces the old rising-edge detection while a key is held.
+    for hotkey_id, vk, name in (
+        (HOTKEY_A_ID, VK_F8, "F8"),
+        (HOTKEY_B_ID, VK_F9, "F9"),
+        (HOTKEY_QUIT_ID, VK_ESCAPE, "Esc"),
+    ):
+        if not user32.RegisterHotKey(None, hotkey_id, MOD_NOREPEAT, vk):
+            _unregister_hotkeys()
+            raise SystemExit(f"RegisterHotKey failed ({name}). Is the overlay (or another app) holding it?")
+
+
+def _unregister_hotkeys() -> None:
+    for hotkey_id in (HOTKEY_A_ID, HOTKEY_B_ID, HOTKEY_QUIT_ID):
+        user32.UnregisterHotKey(None, hotkey_id)
+
+
+def _wait_hotkeys(timeout_ms: int) -> list[int]:
+    # Block (no CPU) until a hotkey arrives or the timeout elapses, then drain the queue.
+    user32.MsgWaitForMultipleObjectsEx(0, None, timeout_ms, QS_HOTKEY, 0)
+    ids: list[int] = []
+    msg = wt.MSG()
+    while user32.PeekMessageW(ctypes.byref(msg), None, WM_HOTKEY, WM_HOTKEY, PM_REMOVE):
+        ids.append(int(msg.wParam))
+    return ids
 
 
 @dataclass(frozen=True)
@@ -70,16 +105,10 @@ def main() -> int:
     p1: tuple[int, int] | None = None
     p2: tuple[int, int] | None = None
 
-    last_print = 0.0
-    f8_was_down = False
-    f9_was_down = False
-    esc_was_down = False
-
-    while True:
-        now = time.time()
-        x, y = _cursor_pos()
-
-        if now - last_print >= 0.10:
+    _register_hotkeys()
+    try:
+        while True:
+            x, y = _cursor_pos()
             sys.stdout.write(
                 f"\rCursor: x={x:5d} y={y:5d}   "
                 f"PointA={'set' if p1 else '---'}   "
@@ -87,39 +116,33 @@ def main() -> int:
                 f"(F8=set A, F9=set B, Esc=quit)     "
             )
             sys.stdout.flush()
-            last_print = now
-
-        f8_down = _key_down(VK_F8)
-        f9_down = _key_down(VK_F9)
-        esc_down = _key_down(VK_ESCAPE)
-
-        # Rising-edge detection (avoid repeat while holding)
-        if f8_down and not f8_was_down:
-            p1 = (x, y)
-            print(f"\nCaptured Point A: {p1}")
-
-        if f9_down and not f9_was_down:
-            p2 = (x, y)
-            print(f"\nCaptured Point B: {p2}")
-
-        if esc_down and not esc_was_down:
-            print("\nExiting.")
-            return 0
-
-        f8_was_down = f8_down
-        f9_was_down = f9_down
-        esc_was_down = esc_down
-
-        if p1 and p2:
-            rect = _make_rect(p1, p2)
-            print()
-            print("Captured rectangle (screen pixels):")
-            print(json.dumps(rect.to_dict(), indent=2))
-            print()
-            print("Paste that JSON back to me exactly. Then we implement the real reader.")
-            return 0
-
-        time.sleep(0.01)
+
+            for hotkey_id in _wait_hotkeys(CURSOR_REFRESH_MS):
+                # Read the cursor at key time, not at the last refresh.
+                x, y = _cursor_pos()
+
+                if hotkey_id == HOTKEY_A_ID:
+                    p1 = (x, y)
+                    print(f"\nCaptured Point A: {p1}")
+
+                if hotkey_id == HOTKEY_B_ID:
+                    p2 = (x, y)
+                    print(f"\nCaptured Point B: {p2}")
+
+                if hotkey_id == HOTKEY_QUIT_ID:
+                    print("\nExiting.")
+                    return 0
+
+            if p1 and p2:
+                rect = _make_rect(p1, p2)
+                print()
+                print("Captured rectangle (screen pixels):")
+                print(json.dumps(rect.to_dict(), indent=2))
+                print()
+                print("Paste that JSON back to me exactly. Then we implement the real reader.")
+                return 0
+    finally:
+        _unregister_hotkeys()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,9 @@ from pathlib import Path
 
 from overlay.screen_clock import Rect
 
+# Parsed configs keyed by (path, mtime_ns, size); a rewrite of the file changes the key.
+_CFG_CACHE: dict[tuple[str, int, int], "OverlayConfig"] = {}
+
 
 @dataclass(frozen=True)
 class OverlayConfig:
@@ -18,10 +21,20 @@ class OverlayConfig:
 
     @staticmethod
     def load(path: Path) -> "OverlayConfig":
+        st = path.stat()
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        cached = _CFG_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         data = json.loads(path.read_text(encoding="utf-8"))
         r = data["clock_rect"]
         rect = Rect(x=int(r["x"]), y=int(r["y"]), w=int(r["w"]), h=int(r["h"]))
-        return OverlayConfig(clock_rect=rect)
+        cfg = OverlayConfig(clock_rect=rect)
+
+        _CFG_CACHE.clear()
+        _CFG_CACHE[key] = cfg
+        return cfg
 
     def save(self, path: Path) -> None:
         data = {"clock_rect": {"x": self.clock_rect.x, "y": self.clock_rect.y, "w": self.clock_rect.w, "h": self.clock_rect.h}}
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import pickle
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 
 # Stable event type strings (JSON-friendly)
 EVENT_MAIN_OBJECTIVE = "main_objective"
@@ -23,6 +26,25 @@ ALL_EVENT_TYPES = {
     EVENT_DROP_PODS,
 }
 
+# Compact ids for the per-mission type_ids array (order is stable; don't reorder).
+_TYPE_ID: Dict[str, int] = {
+    t: i
+    for i, t in enumerate(
+        (
+            EVENT_MAIN_OBJECTIVE,
+            EVENT_BONUS_OBJECTIVE,
+            EVENT_ESCORT,
+            EVENT_ATTACK,
+            EVENT_WARP_IN,
+            EVENT_DROP_PODS,
+        )
+    )
+}
+
+
+# Bump when Mission/MissionEvent change shape so stale pickles are ignored.
+_PICKLE_CACHE_VERSION = 3
+
 
 @dataclass(frozen=True)
 class MissionEvent:
@@ -51,8 +73,15 @@ class Mission:
     duration_s: int  # cycle duration; schedules wrap using this
     events: Tuple[MissionEvent, ...]
 
+    # Type id of each entry of `events` (same order), read-only.
+    type_ids: np.ndarray = field(compare=False, repr=False)  # uint8, see _TYPE_ID
+
     def events_of_type(self, event_type: str) -> Tuple[MissionEvent, ...]:
-        return tuple(e for e in self.events if e.type == event_type)
+        type_id = _TYPE_ID.get(event_type)
+        if type_id is None:
+            return ()
+        idx = np.flatnonzero(self.type_ids == type_id)
+        return tuple(self.events[i] for i in idx)
 
 
 @dataclass(frozen=True)
@@ -64,8 +93,36 @@ class MissionDB:
         # src/overlay/data/missions.json
         return Path(__file__).resolve().parent / "data" / "missions.json"
 
+    @staticmethod
+    def cache_path(path: Path) -> Path:
+        # missions.json -> missions.json.pkl (sidecar next to the source)
+        return path.with_name(path.name + ".pkl")
+
     @staticmethod
     def load(path: Path) -> "MissionDB":
+        # Parsed DB is pickled next to the JSON, tagged with the source's stat.
+        st = path.stat()
+        tag = (_PICKLE_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+        cache_path = MissionDB.cache_path(path)
+
+        try:
+            cached_tag, cached_db = pickle.loads(cache_path.read_bytes())
+        except Exception:
+            cached_tag, cached_db = None, None
+        if cached_tag == tag and isinstance(cached_db, MissionDB):
+            return cached_db
+
+        db = MissionDB._load_json(path)
+
+        try:
+            cache_path.write_bytes(pickle.dumps((tag, db), protocol=5))
+        except OSError:
+            pass  # read-only install; just parse every time
+
+        return db
+
+    @staticmethod
+    def _load_json(path: Path) -> "MissionDB":
         # Tolerate UTF-8 BOM and leading whitespace
         raw = path.read_text(encoding="utf-8-sig").strip()
         if not raw:
@@ -108,11 +165,15 @@ class MissionDB:
             if duration_s <= 0:
                 raise ValueError(f"missions.json: mission {mission_id!r} duration_s must be > 0")
 
+            type_ids = np.asarray([_TYPE_ID[e.type] for e in events], dtype=np.uint8)
+            type_ids.setflags(write=False)
+
             missions[mission_id] = Mission(
                 mission_id=mission_id,
                 name=name,
                 duration_s=duration_s,
                 events=tuple(events),
+                type_ids=type_ids,
             )
 
         if not missions:
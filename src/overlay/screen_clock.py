@@ -1,21 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import hashlib
 import os
-import re
 import threading
 import time
-from dataclasses import dataclass
-from typing import Optional, Tuple
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Optional, Tuple
 
 import ctypes
 import ctypes.wintypes as wt
 
+import numpy as np
+
 user32 = ctypes.windll.user32
 gdi32 = ctypes.windll.gdi32
 ole32 = ctypes.windll.ole32
 
 SRCCOPY = 0x00CC0020
 BI_RGB = 0
+DIB_RGB_COLORS = 0
 
 COINIT_APARTMENTTHREADED = 0x2
 S_OK = 0
@@ -42,6 +48,43 @@ class BITMAPINFO(ctypes.Structure):
     _fields_ = [("bmiHeader", BITMAPINFOHEADER), ("bmiColors", wt.DWORD * 3)]
 
 
+def _top_down_bmi(w: int, h: int) -> BITMAPINFO:
+    # 32bpp BGRA, negative height = rows top to bottom. Built once per DIB section.
+    bmi = BITMAPINFO()
+    bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+    bmi.bmiHeader.biWidth = w
+    bmi.bmiHeader.biHeight = -h
+    bmi.bmiHeader.biPlanes = 1
+    bmi.bmiHeader.biBitCount = 32
+    bmi.bmiHeader.biCompression = BI_RGB
+    bmi.bmiHeader.biSizeImage = w * h * 4
+    return bmi
+
+
+# Declared once so ctypes doesn't infer argument types per call on the capture path,
+# and handles aren't truncated to the default c_int return type on 64-bit Python.
+user32.GetDC.argtypes = [wt.HWND]
+user32.GetDC.restype = wt.HDC
+user32.ReleaseDC.argtypes = [wt.HWND, wt.HDC]
+gdi32.CreateCompatibleDC.argtypes = [wt.HDC]
+gdi32.CreateCompatibleDC.restype = wt.HDC
+gdi32.CreateDIBSection.argtypes = [
+    wt.HDC, ctypes.POINTER(BITMAPINFO), wt.UINT, ctypes.POINTER(ctypes.c_void_p), wt.HANDLE, wt.DWORD,
+]
+gdi32.CreateDIBSection.restype = wt.HBITMAP
+gdi32.SelectObject.argtypes = [wt.HDC, wt.HGDIOBJ]
+gdi32.SelectObject.restype = wt.HGDIOBJ
+gdi32.DeleteObject.argtypes = [wt.HGDIOBJ]
+gdi32.DeleteDC.argtypes = [wt.HDC]
+gdi32.BitBlt.argtypes = [
+    wt.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+    wt.HDC, ctypes.c_int, ctypes.c_int, wt.DWORD,
+]
+gdi32.BitBlt.restype = wt.BOOL
+gdi32.GdiFlush.argtypes = []
+gdi32.GdiFlush.restype = wt.BOOL
+
+
 @dataclass(frozen=True)
 class Rect:
     x: int
@@ -50,51 +93,14 @@ class Rect:
     h: int
 
 
-def _capture_bgra(rect: Rect) -> bytes:
-    hdc_screen = user32.GetDC(None)
-    if not hdc_screen:
-        raise RuntimeError("GetDC(None) failed")
-
-    hdc_mem = gdi32.CreateCompatibleDC(hdc_screen)
-    if not hdc_mem:
-        user32.ReleaseDC(None, hdc_screen)
-        raise RuntimeError("CreateCompatibleDC failed")
-
-    hbmp = gdi32.CreateCompatibleBitmap(hdc_screen, rect.w, rect.h)
-    if not hbmp:
-        gdi32.DeleteDC(hdc_mem)
-        user32.ReleaseDC(None, hdc_screen)
-        raise RuntimeError("CreateCompatibleBitmap failed")
+def _write_png_from_gray(path: str, gray: bytes, w: int, h: int) -> None:
+    from PySide6.QtGui import QImage
 
-    old = gdi32.SelectObject(hdc_mem, hbmp)
-    try:
-        if not gdi32.BitBlt(
-            hdc_mem, 0, 0, rect.w, rect.h, hdc_screen, rect.x, rect.y, SRCCOPY
-        ):
-            raise RuntimeError("BitBlt failed")
-
-        bmi = BITMAPINFO()
-        bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
-        bmi.bmiHeader.biWidth = rect.w
-        bmi.bmiHeader.biHeight = -rect.h
-        bmi.bmiHeader.biPlanes = 1
-        bmi.bmiHeader.biBitCount = 32
-        bmi.bmiHeader.biCompression = BI_RGB
-        bmi.bmiHeader.biSizeImage = rect.w * rect.h * 4
-
-        buf = (ctypes.c_ubyte * (rect.w * rect.h * 4))()
-        lines = gdi32.GetDIBits(
-            hdc_mem, hbmp, 0, rect.h, ctypes.byref(buf), ctypes.byref(bmi), 0
-        )
-        if lines != rect.h:
-            raise RuntimeError(f"GetDIBits failed (lines={lines})")
-
-        return bytes(buf)
-    finally:
-        gdi32.SelectObject(hdc_mem, old)
-        gdi32.DeleteObject(hbmp)
-        gdi32.DeleteDC(hdc_mem)
-        user32.ReleaseDC(None, hdc_screen)
+    # Explicit bytesPerLine: QImage otherwise assumes 32-bit aligned rows.
+    img = QImage(gray, w, h, w, QImage.Format.Format_Grayscale8)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if not img.save(path):
+        raise RuntimeError(f"Failed to save image: {path}")
 
 
 def _write_png_from_bgra(path: str, bgra: bytes, w: int, h: int) -> None:
@@ -106,61 +112,74 @@ def _write_png_from_bgra(path: str, bgra: bytes, w: int, h: int) -> None:
         raise RuntimeError(f"Failed to save image: {path}")
 
 
-def _dilate_mask(mask: bytearray, w: int, h: int, iters: int = 1) -> bytearray:
-    if iters <= 0:
-        return mask
+# Integer Rec. 709 luma weights. They sum to 256, so (w . rgb) >> 8 is a weighted
+# mean in 0..255; the largest sum, 256 * 255, still fits in uint16.
+LUM_WR = 54
+LUM_WG = 183
+LUM_WB = 19
+
+
+def _luma_planes(a: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(lum, g, r, b) uint16 planes of an (h, w, 4) BGRA uint8 array."""
+    b = a[..., 0].astype(np.uint16)
+    g = a[..., 1].astype(np.uint16)
+    r = a[..., 2].astype(np.uint16)
+    lum = (np.uint16(LUM_WR) * r + np.uint16(LUM_WG) * g + np.uint16(LUM_WB) * b) >> 8
+    return lum, g, r, b
+
+
+def _dilate_mask(mask: np.ndarray, iters: int = 1) -> np.ndarray:
+    # 3x3 binary dilation of an (h, w) bool mask with a zero border, done
+    # separably: a 1x3 row OR then a 3x1 column OR per iteration.
     cur = mask
     for _ in range(iters):
-        nxt = bytearray(w * h)
-        for y in range(h):
-            y0 = max(0, y - 1)
-            y1 = min(h - 1, y + 1)
-            for x in range(w):
-                x0 = max(0, x - 1)
-                x1 = min(w - 1, x + 1)
-                v = 0
-                for yy in range(y0, y1 + 1):
-                    row = yy * w
-                    for xx in range(x0, x1 + 1):
-                        if cur[row + xx]:
-                            v = 1
-                            break
-                    if v:
-                        break
-                nxt[y * w + x] = v
-        cur = nxt
+        row = cur.copy()
+        row[:, 1:] |= cur[:, :-1]
+        row[:, :-1] |= cur[:, 1:]
+        cur = row.copy()
+        cur[1:, :] |= row[:-1, :]
+        cur[:-1, :] |= row[1:, :]
     return cur
 
 
+def _upscale_nearest(src: np.ndarray, scale: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    # Nearest-neighbour upscale of a (h, w) plane into `out` (allocated if None).
+    # Each row is widened once, then copied `scale` times as whole rows.
+    # Broadcasting both axes at once is slower: the stride-0 inner axis defeats
+    # contiguous copying.
+    # `out` may be a row-strided view (e.g. a bitmap plane with padded rows).
+    h, w = src.shape
+    if out is None:
+        out = np.empty((h * scale, w * scale), dtype=src.dtype)
+    if scale == 1:
+        out[...] = src
+        return out
+    rows = np.repeat(src, scale, axis=1)
+    # Splitting axis 0 never needs a copy; setting .shape raises rather than copy.
+    groups = out.view()
+    groups.shape = (h, scale, w * scale)
+    groups[...] = rows[:, None, :]
+    return out
+
+
 def _auto_crop_to_glyph_band(
-    bgra: bytes, w: int, h: int
-) -> tuple[bytes, int, int, tuple[int, int, int, int]]:
-    x_min = w
-    y_min = h
-    x_max = -1
-    y_max = -1
-
-    idx = 0
-    for y in range(h):
-        for x in range(w):
-            b = bgra[idx]
-            g = bgra[idx + 1]
-            r = bgra[idx + 2]
-            idx += 4
-
-            lum = (54 * r + 183 * g + 19 * b) // 256
-            if lum >= 35 and g >= 40 and g >= r and g >= b:
-                if x < x_min:
-                    x_min = x
-                if y < y_min:
-                    y_min = y
-                if x > x_max:
-                    x_max = x
-                if y > y_max:
-                    y_max = y
-
-    if x_max < 0 or y_max < 0:
-        return bgra, w, h, (0, 0, w, h)
+    arr: np.ndarray, w: int, h: int
+) -> tuple[np.ndarray, int, int, tuple[int, int, int, int]]:
+    # arr is (h, w, 4) BGRA (bytes also accepted). The result is always a fresh
+    # contiguous array, never a view of arr, so callers may hold it while the
+    # capture buffer is reused.
+    a = np.frombuffer(arr, dtype=np.uint8).reshape(h, w, 4)
+    lum, g, r, b = _luma_planes(a)
+    mask = (lum >= 35) & (g >= 40) & (g >= r) & (g >= b)
+
+    cols = np.flatnonzero(mask.any(axis=0))
+    if cols.size == 0:
+        return a.copy(), w, h, (0, 0, w, h)
+    rows = np.flatnonzero(mask.any(axis=1))
+    x_min = int(cols[0])
+    x_max = int(cols[-1])
+    y_min = int(rows[0])
+    y_max = int(rows[-1])
 
     PAD_X = 3
     PAD_Y = 2
@@ -173,84 +192,89 @@ def _auto_crop_to_glyph_band(
     ch = (y1 - y0) + 1
 
     if cw < 20 or ch < 10:
-        return bgra, w, h, (0, 0, w, h)
-
-    out = bytearray(cw * ch * 4)
-    for yy in range(ch):
-        src_row = ((y0 + yy) * w + x0) * 4
-        dst_row = yy * cw * 4
-        out[dst_row : dst_row + cw * 4] = bgra[src_row : src_row + cw * 4]
-
-    return bytes(out), cw, ch, (x0, y0, cw, ch)
-
-
-def _preprocess_clock_bgra(
-    bgra: bytes,
-    w: int,
-    h: int,
-    *,
-    scale: int,
-    lum_threshold: int,
-    g_min: int,
-    dilate_iters: int,
-) -> tuple[bytes, int, int]:
-    if scale < 1:
-        raise ValueError("scale must be >= 1")
-
-    mask = bytearray(w * h)
-    mi = 0
-    for i in range(0, len(bgra), 4):
-        b = int(bgra[i])
-        g = int(bgra[i + 1])
-        r = int(bgra[i + 2])
-
-        lum = (54 * r + 183 * g + 19 * b) // 256
-        is_digit = (lum >= lum_threshold) and (g >= g_min) and (g >= r) and (g >= b)
-        mask[mi] = 1 if is_digit else 0
-        mi += 1
-
-    if dilate_iters > 0:
-        mask = _dilate_mask(mask, w, h, iters=dilate_iters)
-
-    mono = bytearray(w * h * 4)
-    for p in range(w * h):
-        v = 0 if mask[p] else 255
-        j = p * 4
-        mono[j] = v
-        mono[j + 1] = v
-        mono[j + 2] = v
-        mono[j + 3] = 255
+        return a.copy(), w, h, (0, 0, w, h)
 
-    if scale == 1:
-        return bytes(mono), w, h
-
-    w2 = w * scale
-    h2 = h * scale
-    out = bytearray(w2 * h2 * 4)
-
-    for y in range(h):
-        src_row = y * w * 4
-        dy0 = y * scale
-        for x in range(w):
-            si = src_row + x * 4
-            v = mono[si]
-            dx0 = x * scale
-            for yy in range(scale):
-                di_row = ((dy0 + yy) * w2 + dx0) * 4
-                for xx in range(scale):
-                    di = di_row + xx * 4
-                    out[di] = v
-                    out[di + 1] = v
-                    out[di + 2] = v
-                    out[di + 3] = 255
-
-    return bytes(out), w2, h2
+    return a[y0 : y1 + 1, x0 : x1 + 1].copy(), cw, ch, (x0, y0, cw, ch)
+
+
+try:
+    from scipy.ndimage import binary_dilation as _binary_dilation  # type: ignore
+except Exception:  # pragma: no cover
+    _binary_dilation = None  # type: ignore
+
+# Full 3x3 neighbourhood, matching _dilate_mask (scipy's default is a cross).
+_DILATE_STRUCT = np.ones((3, 3), dtype=bool)
+
+
+_kernels: Any = None  # overlay.screen_clock_kernels, False if numba is missing, None until tried
+
+
+def _numba_kernels() -> Any:
+    global _kernels
+    if _kernels is None:
+        try:
+            from overlay import screen_clock_kernels as k
+        except Exception:  # pragma: no cover
+            k = False
+        _kernels = k
+    return _kernels or None
+
+
+def _dilate(mask: np.ndarray, iters: int) -> np.ndarray:
+    # 3x3 dilation of an (h, w) bool mask; returns a new array, mask is untouched.
+    if _binary_dilation is not None:
+        return _binary_dilation(mask, structure=_DILATE_STRUCT, iterations=iters)
+    k = _numba_kernels()
+    if k is not None:
+        return k.dilate3x3(mask.view(np.uint8), iters).view(bool)
+    return _dilate_mask(mask, iters)
+
+
+class _CropPreprocessor:
+    # Runs the variant search's preprocess for one crop. The luma/green planes are
+    # computed once, masks are cached per (lum_threshold, g_min) pair and mono
+    # planes per (lum_threshold, g_min, dilate_iters), so most variants only pay
+    # for their upscale. Output is (h, w) GRAY8: 0 = digit, 255 = background.
+
+    def __init__(self, bgra: np.ndarray, w: int, h: int) -> None:
+        lum, g, r, b = _luma_planes(np.frombuffer(bgra, dtype=np.uint8).reshape(h, w, 4))
+        self._lum = lum
+        self._g = g
+        self._g_dominant = (g >= r) & (g >= b)
+        self._masks: dict[tuple[int, int], np.ndarray] = {}
+        self._monos: dict[tuple[int, int, int], np.ndarray] = {}
+
+    def _mask(self, lum_threshold: int, g_min: int) -> np.ndarray:
+        key = (lum_threshold, g_min)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._masks[key] = (self._lum >= lum_threshold) & (self._g >= g_min) & self._g_dominant
+        return mask
+
+    def _mono(self, lum_threshold: int, g_min: int, dilate_iters: int) -> np.ndarray:
+        key = (lum_threshold, g_min, dilate_iters)
+        mono = self._monos.get(key)
+        if mono is None:
+            mask = self._mask(lum_threshold, g_min)
+            if dilate_iters > 0:
+                mask = _dilate(mask, dilate_iters)
+            mono = self._monos[key] = np.where(mask, 0, 255).astype(np.uint8)
+        return mono
+
+    def run(self, v: Variant) -> np.ndarray:
+        # The unscaled mono plane; the variant's upscale happens when it's written
+        # into the OCR bitmap (see _write_software_bitmap).
+        scale, lum_threshold, g_min, dilate_iters = v
+        if scale < 1:
+            raise ValueError("scale must be >= 1")
+        return self._mono(lum_threshold, g_min, dilate_iters)
 
 
 try:
     from winrt.windows.media.ocr import OcrEngine  # type: ignore
     from winrt.windows.graphics.imaging import (  # type: ignore
         BitmapAlphaMode,
+        BitmapBufferAccessMode,
         BitmapPixelFormat,
         SoftwareBitmap,
     )
@@ -262,19 +286,93 @@ else:
     _WINRT_IMPORT_ERROR = None  # type: ignore
 
 
-_MMSS_RE = re.compile(r"(?P<mm>\d{1,2})\s*[:]\s*(?P<ss>\d{2})")
+class _MmssKeepTable(dict):
+    # str.translate table: keep ASCII digits and ':', turn whitespace into ' ' and
+    # anything else into '#', so separate tokens never merge. Unknown chars are
+    # resolved once via __missing__, then hit the dict in C.
+    def __missing__(self, key: int) -> int:
+        v = self[key] = 32 if chr(key).isspace() else 35  # ' ' / '#'
+        return v
+
+
+# Letters the recognizer commonly returns in place of HUD digits.
+_OCR_FIX = {"O": "0", "o": "0", "l": "1", "I": "1", "S": "5", "B": "8", "Z": "2"}
+
+_MMSS_KEEP = _MmssKeepTable({ord(c): ord(c) for c in "0123456789:"})
+_MMSS_KEEP_FIXED = _MmssKeepTable(_MMSS_KEEP)
+_MMSS_KEEP_FIXED.update({ord(k): ord(v) for k, v in _OCR_FIX.items()})
+
+
+def _scan_mmss(s: str) -> Optional[int]:
+    # s holds only digits, ':', ' ' and '#'. Same match as the old
+    # r"(\d{1,2})\s*:\s*(\d{2})" search: the first ':' with 1-2 digits directly
+    # before it and 2 after, whitespace allowed only around the ':'.
+    n = len(s)
+    i = s.find(":")
+    while i != -1:
+        j = i - 1
+        while j >= 0 and s[j] == " ":
+            j -= 1
+        k = i + 1
+        while k < n and s[k] == " ":
+            k += 1
+        if j >= 0 and "0" <= s[j] <= "9" and k + 1 < n and "0" <= s[k] <= "9" and "0" <= s[k + 1] <= "9":
+            mm = ord(s[j]) - 48
+            if j >= 1 and "0" <= s[j - 1] <= "9":
+                mm += (ord(s[j - 1]) - 48) * 10
+            ss = (ord(s[k]) - 48) * 10 + (ord(s[k + 1]) - 48)
+            return mm * 60 + ss if ss <= 59 else None
+        i = s.find(":", i + 1)
+    return None
+
+
+def _parse_mmss(text: str) -> Optional[int]:
+    """
+    Parse the first MM:SS (M:SS) in OCR text to seconds, or None. The O->0, l->1,
+    ... fixes are only a fallback for text that has no MM:SS without them, so they
+    never glue a stray letter onto a time that already parses ("S1:20" is 1:20).
+    """
+    t = _scan_mmss(text.translate(_MMSS_KEEP))
+    if t is None:
+        t = _scan_mmss(text.translate(_MMSS_KEEP_FIXED))
+    return t
+
+
+def _write_software_bitmap(sb: "SoftwareBitmap", mono: np.ndarray, scale: int) -> None:
+    # Upscale the (h, w) mono plane straight into the bitmap's locked GRAY8 plane:
+    # no intermediate upscaled array, and no DataWriter -> IBuffer -> copy_from_buffer.
+    h, w = mono.shape
+    buf = sb.lock_buffer(BitmapBufferAccessMode.WRITE)
+    try:
+        ref = buf.create_reference()
+        try:
+            plane = buf.get_plane_description(0)
+            with memoryview(ref) as mv:
+                dst = np.ndarray(
+                    (h * scale, w * scale), dtype=np.uint8, buffer=mv, offset=plane.start_index, strides=(plane.stride, 1)
+                )
+                try:
+                    _upscale_nearest(mono, scale, out=dst)
+                except BaseException as e:
+                    # The failed frames still hold `out`; drop them so the view can close
+                    # and the real error isn't masked by a BufferError.
+                    traceback.clear_frames(e.__traceback__)
+                    raise
+                finally:
+                    del dst  # release the export before the memoryview closes
+        finally:
+            ref.close()
+    finally:
+        buf.close()
 
 
-def _bgra_to_software_bitmap(bgra: bytes, w: int, h: int) -> "SoftwareBitmap":
-    sb = SoftwareBitmap(BitmapPixelFormat.BGRA8, w, h, BitmapAlphaMode.IGNORE)
-    writer = DataWriter()
-    writer.write_bytes(bgra)
-    ibuf = writer.detach_buffer()
-    sb.copy_from_buffer(ibuf)
-    return sb
+Variant = Tuple[int, int, int, int]  # (scale, lum_threshold, g_min, dilate_iters)
 
+# Variant recognitions in flight at once after the preferred variant misses.
+_OCR_CONCURRENCY = 3
 
-Variant = Tuple[int, int, int, int]  # (scale, lum_threshold, g_min, dilate_iters)
+# 3 scales x a few crop sizes x _OCR_CONCURRENCY slots; cleared wholesale when full.
+_SB_CACHE_MAX = 32
 
 
 def _variant_tag(v: Variant) -> str:
@@ -282,6 +380,33 @@ def _variant_tag(v: Variant) -> str:
     return f"s{s}_lum{lum}_g{gmin}_d{di}"
 
 
+# Reduced search space (36 variants, not 96) for long-run stability.
+_VARIANT_AXES: tuple[tuple[int, ...], ...] = ((8, 6, 4), (70, 60), (80, 60, 100), (0, 1))
+_VARIANTS: tuple[Variant, ...] = tuple(
+    (s, lum, gmin, di) for s in _VARIANT_AXES[0] for lum in _VARIANT_AXES[1] for gmin in _VARIANT_AXES[2] for di in _VARIANT_AXES[3]
+)
+_VARIANT_RANK: tuple[dict[int, int], ...] = tuple({p: i for i, p in enumerate(sorted(axis))} for axis in _VARIANT_AXES)
+_VARIANT_ORDER_CACHE: dict[Optional[Variant], tuple[Variant, ...]] = {}
+
+
+def _variants_near(pref: Optional[Variant]) -> tuple[Variant, ...]:
+    """All variants, ordered by steps from `pref` along each (sorted) parameter axis."""
+    order = _VARIANT_ORDER_CACHE.get(pref)
+    if order is None:
+        if pref is None or pref not in _VARIANTS:
+            order = _VARIANTS
+        else:
+            pos = [rank[p] for rank, p in zip(_VARIANT_RANK, pref)]
+
+            def dist(v: Variant) -> int:
+                return sum(abs(rank[p] - i) for rank, p, i in zip(_VARIANT_RANK, v, pos))
+
+            # Stable sort: ties keep the canonical order; pref (distance 0) comes first.
+            order = tuple(sorted(_VARIANTS, key=dist))
+        _VARIANT_ORDER_CACHE[pref] = order
+    return order
+
+
 @dataclass
 class ScreenClock:
     rect: Rect
@@ -292,28 +417,69 @@ class ScreenClock:
     dropout_grace_s: float = 10.0
     holdover_s: float = 600.0  # 10 minutes; prevents --:-- during long OCR droughts
 
+    # Drift correction allowed per correction_period_s of wall time (the old 20 Hz UI
+    # poll), so the slew rate doesn't depend on how often display_time() is called.
     max_correction_per_tick_s: int = 1
+    correction_period_s: float = 0.05
 
     # If worker fails to parse for this long, rebuild OCR engine.
     engine_reset_after_fail_s: float = 20.0
 
+    # After a good read, wait this fraction of a game-second before OCR-ing again;
+    # the HUD clock can't change sooner and display_time() extrapolates meanwhile.
+    ocr_gap_after_ok_ticks: float = 0.9
+
     _engine: Optional["OcrEngine"] = None
 
+    # Guards _last_ocr_text only.
     _lock: threading.Lock = threading.Lock()
-    _ocr_lock: threading.Lock = threading.Lock()
-
-    _last_observed_s: Optional[int] = None
-    _last_observed_wall_mono: float = 0.0
     _last_ocr_text: str = ""
 
-    _disp_s: Optional[int] = None
-    _disp_next_tick_mono: float = 0.0
+    # Immutable tuples replaced wholesale, so readers get a consistent snapshot
+    # without locking. Each has a single writer: the worker owns _obs
+    # (observed_s, observed_mono_ns), the UI thread owns _disp
+    # (disp_s, disp_next_tick_ns, last_call_ns).
+    _obs: tuple[Optional[int], int] = (None, 0)
+    _disp: tuple[Optional[int], int, int] = (None, 0, 0)
+
+    # display_time() works in integer perf_counter_ns(); derived in __post_init__.
+    _tick_period_ns: int = 0
+    _dropout_grace_ns: int = 0
+    _holdover_end_ns: int = 0
+    _correction_period_ns: int = 0
 
     _preferred_variant: Optional[Variant] = None
+    _ocr_gray8_ok: bool = True
     _last_parse_ok_mono: float = 0.0
 
+    # (w, h, blake2b-64) of the last glyph band that parsed, and what it parsed to.
+    _last_crop_key: Optional[tuple[int, int, bytes]] = None
+    _last_crop_result: tuple[Optional[int], Optional[Variant]] = (None, None)
+
     _stop_evt: threading.Event = threading.Event()
     _thread: Optional[threading.Thread] = None
+    # All OCR runs on the worker's event loop; the asyncio lock serializes the
+    # worker's variant search with debug snapshots scheduled onto that loop.
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _ocr_alock: Optional[asyncio.Lock] = None
+
+    # GRAY8 SoftwareBitmaps keyed by (w, h, slot), rewritten in place for each OCR
+    # call. The crop band (and so the size) only shifts by a few pixels as digits change.
+    _sb_cache: Optional[dict[tuple[int, int, int], "SoftwareBitmap"]] = None
+    # Set once the direct buffer write is found unsupported; reused for every copy after.
+    _sb_writer: Optional["DataWriter"] = None
+
+    # GDI capture objects, created once and only rebuilt if the rect's size changes.
+    # The lock is per instance: clocks on different rects don't serialize each other.
+    _gdi_lock: threading.RLock = field(default_factory=threading.RLock)
+    _hdc_screen: Optional[int] = None
+    _hdc_mem: Optional[int] = None
+    _hbmp: Optional[int] = None
+    _hbmp_old: Optional[int] = None
+    _bmi: Optional[BITMAPINFO] = None
+    _pixbuf: Optional[ctypes.Array] = None  # the DIB section's bits
+    _pixview: Optional[np.ndarray] = None  # zero-copy (h, w, 4) view of _pixbuf
+    _gdi_size: Optional[tuple[int, int]] = None
 
     def __post_init__(self) -> None:
         if OcrEngine is None:
@@ -322,9 +488,16 @@ class ScreenClock:
                 "Install in your venv:\n"
                 "  pip install winrt-Windows.Foundation winrt-Windows.Media.Ocr "
                 "winrt-Windows.Graphics.Imaging winrt-Windows.Storage.Streams\n"
+                "(numpy is required too; scipy or numba optionally speed up preprocessing)\n"
                 f"Import error: {_WINRT_IMPORT_ERROR!r}"
             )
         self._engine = OcrEngine.try_create_from_user_profile_languages()
+        self._sb_cache = {}
+        self._tick_period_ns = max(1, round(1e9 / max(0.01, float(self.game_speed_multiplier))))
+        self._dropout_grace_ns = round(self.dropout_grace_s * 1e9)
+        self._holdover_end_ns = round((self.dropout_grace_s + self.holdover_s) * 1e9)
+        self._correction_period_ns = max(1, round(self.correction_period_s * 1e9))
+        self._open_gdi()
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -338,29 +511,60 @@ class ScreenClock:
         t = self._thread
         if t and t.is_alive():
             t.join(timeout=1.0)
+        self._close_gdi()
+
+    def __del__(self) -> None:
+        # Backstop for clocks dropped without stop(); GDI handles are per-process.
+        try:
+            self._close_gdi()
+        except Exception:
+            pass
 
     def last_raw_text(self) -> str:
         with self._lock:
             return self._last_ocr_text
 
     def debug_snapshot(self) -> dict:
-        raw_full = _capture_bgra(self.rect)
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            fut = asyncio.run_coroutine_threadsafe(self._debug_snapshot_async(), loop)
+            try:
+                return fut.result(timeout=30.0)
+            except (concurrent.futures.TimeoutError, concurrent.futures.CancelledError) as e:
+                # Worker loop busy or stopping: report it instead of raising into the hotkey.
+                fut.cancel()
+                return {
+                    "rect": {"x": self.rect.x, "y": self.rect.y, "w": self.rect.w, "h": self.rect.h},
+                    "error": f"snapshot did not complete: {type(e).__name__}",
+                    "best": {"tag": "none", "proc_path": None, "ocr_text": "", "parsed_seconds": None},
+                    "tried_count": 0,
+                }
+        return asyncio.run(self._debug_snapshot_async())
+
+    async def _debug_snapshot_async(self) -> dict:
+        with self._gdi_lock:
+            raw_full = self._capture_bgra()
+            raw_full_bytes = raw_full.tobytes()
+            fh, fw = raw_full.shape[:2]
+            raw, rw, rh, used_local = _auto_crop_to_glyph_band(raw_full, fw, fh)
+
         ts = time.strftime("%Y%m%d_%H%M%S")
         raw_path = os.path.join(os.getcwd(), ".debug", f"clock_raw_{ts}.png")
-        _write_png_from_bgra(raw_path, raw_full, self.rect.w, self.rect.h)
+        _write_png_from_bgra(raw_path, raw_full_bytes, fw, fh)
 
-        raw, rw, rh, used_local = _auto_crop_to_glyph_band(raw_full, self.rect.w, self.rect.h)
         crop_path = os.path.join(os.getcwd(), ".debug", f"clock_crop_{ts}.png")
-        _write_png_from_bgra(crop_path, raw, rw, rh)
+        _write_png_from_bgra(crop_path, raw.tobytes(), rw, rh)
 
         best = None
         tried = []
 
-        with self._ocr_lock:
-            for idx, (proc, pw, ph, tag) in enumerate(self._iter_preprocess_variants(raw, rw, rh)):
+        async with self._ocr_alock or asyncio.Lock():
+            for idx, (mono, v) in enumerate(self._iter_preprocess_variants(raw, rw, rh)):
+                tag = _variant_tag(v)
                 proc_path = os.path.join(os.getcwd(), ".debug", f"clock_proc_{ts}_{idx}_{tag}.png")
-                _write_png_from_bgra(proc_path, proc, pw, ph)
-                text, parsed = self._ocr_once_locked(proc, pw, ph)
+                proc = _upscale_nearest(mono, v[0])
+                _write_png_from_gray(proc_path, proc.tobytes(), proc.shape[1], proc.shape[0])
+                text, parsed = await self._ocr_once_locked(mono, v[0])
                 tried.append({"tag": tag, "proc_path": proc_path, "ocr_text": text, "parsed_seconds": parsed})
                 if parsed is not None and best is None:
                     best = tried[-1]
@@ -378,119 +582,216 @@ class ScreenClock:
         }
 
     def display_time(self) -> tuple[Optional[int], str]:
-        now_m = time.perf_counter()
-        tick_period = 1.0 / max(0.01, float(self.game_speed_multiplier))
+        now_ns = time.perf_counter_ns()
+        tick_ns = self._tick_period_ns
 
-        with self._lock:
-            obs_s = self._last_observed_s
-            obs_m = self._last_observed_wall_mono
-            disp_s = self._disp_s
-            disp_next = self._disp_next_tick_mono
+        obs_s, obs_ns = self._obs
+        disp_s, disp_next, last_ns = self._disp
 
         if obs_s is None and disp_s is None:
             return None, "--:--"
 
-        obs_age = (now_m - obs_m) if obs_s is not None else 999999.0
-
-        # Holdover tick when OCR is stale.
-        if obs_age > self.dropout_grace_s:
+        # Holdover tick when OCR is stale (or never observed).
+        obs_age = (now_ns - obs_ns) if obs_s is not None else None
+        if obs_age is None or obs_age > self._dropout_grace_ns:
             if disp_s is None:
                 return None, "--:--"
-            if obs_age > (self.dropout_grace_s + self.holdover_s):
+            if obs_age is None or obs_age > self._holdover_end_ns:
                 return None, "--:--"
 
-            if now_m >= disp_next:
-                steps = int((now_m - disp_next) // tick_period) + 1
+            if now_ns >= disp_next:
+                steps = (now_ns - disp_next) // tick_ns + 1
                 disp_s += steps
-                disp_next += steps * tick_period
+                disp_next += steps * tick_ns
 
-            with self._lock:
-                self._disp_s = disp_s
-                self._disp_next_tick_mono = disp_next
+            self._disp = (disp_s, disp_next, now_ns)
 
             shown = max(0, disp_s + self.time_offset_s)
             return shown, f"{shown // 60:02d}:{shown % 60:02d}"
 
         # OCR fresh: estimate from observed.
         assert obs_s is not None
-        est = obs_s + int((now_m - obs_m) * self.game_speed_multiplier)
+        est = obs_s + (now_ns - obs_ns) // tick_ns
 
         if disp_s is None:
             disp_s = est
-            disp_next = now_m + tick_period
+            disp_next = now_ns + tick_ns
         else:
-            if now_m >= disp_next:
-                steps = int((now_m - disp_next) // tick_period) + 1
+            if now_ns >= disp_next:
+                steps = (now_ns - disp_next) // tick_ns + 1
                 disp_s += steps
-                disp_next += steps * tick_period
+                disp_next += steps * tick_ns
 
             delta = est - disp_s
             if delta != 0:
-                corr = max(-self.max_correction_per_tick_s, min(self.max_correction_per_tick_s, delta))
-                disp_s += corr
+                periods = max(1, (now_ns - last_ns) // self._correction_period_ns)
+                cap = self.max_correction_per_tick_s * periods
+                disp_s += max(-cap, min(cap, delta))
 
-        with self._lock:
-            self._disp_s = disp_s
-            self._disp_next_tick_mono = disp_next
+        self._disp = (disp_s, disp_next, now_ns)
 
         shown = max(0, disp_s + self.time_offset_s)
         return shown, f"{shown // 60:02d}:{shown % 60:02d}"
 
-    # ---------------- internal ----------------
-
-    def _iter_preprocess_variants(self, raw_bgra: bytes, w: int, h: int):
-        # Reduced search space (36 variants, not 96) for long-run stability.
-        base_scales = [8, 6, 4]
-        base_lum = [70, 60]
-        base_gmin = [80, 60, 100]
-        base_di = [0, 1]
-
-        variants: list[Variant] = [(s, lum, gmin, di) for s in base_scales for lum in base_lum for gmin in base_gmin for di in base_di]
-
-        # Try last-known-good variant first.
-        pref = self._preferred_variant
-        if pref is not None and pref in variants:
-            variants.remove(pref)
-            variants.insert(0, pref)
-
-        for v in variants:
-            scale, lum_th, g_min, di = v
-            proc, pw, ph = _preprocess_clock_bgra(
-                raw_bgra,
-                w,
-                h,
-                scale=scale,
-                lum_threshold=lum_th,
-                g_min=g_min,
-                dilate_iters=di,
-            )
-            yield proc, pw, ph, _variant_tag(v)
-
-    def _ocr_once_locked(self, proc_bgra: bytes, pw: int, ph: int) -> tuple[str, Optional[int]]:
-        sb = _bgra_to_software_bitmap(proc_bgra, pw, ph)
+    def ns_until_next_tick(self) -> Optional[int]:
+        """
+        Nanoseconds until display_time() next advances on its own, or None while
+        it shows --:--. Lets the UI wake on game-second boundaries instead of polling,
+        and every correction_period_s while it is still catching up to OCR.
+        """
+        now_ns = time.perf_counter_ns()
+        obs_s, obs_ns = self._obs
+        disp_s, disp_next, _ = self._disp
+        if disp_s is None:
+            return None
+        # Same cut-off as display_time(): past holdover (or never observed) it
+        # shows --:-- while _disp keeps its stale deadline.
+        if obs_s is None or now_ns - obs_ns > self._holdover_end_ns:
+            return None
+        wait = max(0, disp_next - now_ns)
+        # Still slewing towards a fresh OCR estimate: wake every correction period
+        # so the display converges in small steps instead of jumping once per tick.
+        if now_ns - obs_ns <= self._dropout_grace_ns:
+            est = obs_s + (now_ns - obs_ns) // self._tick_period_ns
+            if est != disp_s:
+                wait = min(wait, self._correction_period_ns)
+        return wait
 
-        import asyncio
+    # ---------------- internal ----------------
 
-        async def _do_ocr() -> str:
-            assert self._engine is not None
-            result = await self._engine.recognize_async(sb)
-            return (result.text or "").strip()
+    def _open_gdi(self) -> None:
+        w, h = self.rect.w, self.rect.h
+
+        hdc_screen = user32.GetDC(None)
+        if not hdc_screen:
+            raise RuntimeError("GetDC(None) failed")
+
+        hdc_mem = gdi32.CreateCompatibleDC(hdc_screen)
+        if not hdc_mem:
+            user32.ReleaseDC(None, hdc_screen)
+            raise RuntimeError("CreateCompatibleDC failed")
+
+        bmi = _top_down_bmi(w, h)
+
+        # A top-down 32bpp DIB section: BitBlt writes straight into memory we can
+        # read, so there is no DDB -> DIB copy (GetDIBits) per frame.
+        bits = ctypes.c_void_p()
+        hbmp = gdi32.CreateDIBSection(hdc_mem, ctypes.byref(bmi), DIB_RGB_COLORS, ctypes.byref(bits), None, 0)
+        if not hbmp or not bits.value:
+            gdi32.DeleteDC(hdc_mem)
+            user32.ReleaseDC(None, hdc_screen)
+            raise RuntimeError("CreateDIBSection failed")
+
+        with self._gdi_lock:
+            self._hdc_screen = hdc_screen
+            self._hdc_mem = hdc_mem
+            self._hbmp = hbmp
+            self._hbmp_old = gdi32.SelectObject(hdc_mem, hbmp)
+            self._bmi = bmi
+            self._pixbuf = (ctypes.c_ubyte * (w * h * 4)).from_address(bits.value)
+            self._pixview = np.frombuffer(self._pixbuf, dtype=np.uint8).reshape(h, w, 4)
+            self._gdi_size = (w, h)
+
+    def _close_gdi(self) -> None:
+        with self._gdi_lock:
+            if self._hdc_mem:
+                gdi32.SelectObject(self._hdc_mem, self._hbmp_old)
+                gdi32.DeleteObject(self._hbmp)
+                gdi32.DeleteDC(self._hdc_mem)
+            if self._hdc_screen:
+                user32.ReleaseDC(None, self._hdc_screen)
+            self._hdc_screen = self._hdc_mem = self._hbmp = self._hbmp_old = None
+            self._bmi = None
+            self._pixbuf = None
+            self._pixview = None
+            self._gdi_size = None
+
+    def _ensure_gdi(self) -> None:
+        # Must be called under _gdi_lock. The DIB is sized for the rect, so a rect
+        # of a different size (position alone doesn't matter) needs a new one.
+        if self._gdi_size != (self.rect.w, self.rect.h):
+            self._close_gdi()
+            self._open_gdi()
+
+    def _capture_bgra(self) -> np.ndarray:
+        # Returns a view of the DIB section's pixels. It is overwritten by the next
+        # capture and freed by _close_gdi, so callers hold _gdi_lock (re-entrant)
+        # until they have copied what they need. Size it by the view's shape, not
+        # self.rect, in case the rect is swapped concurrently.
+        with self._gdi_lock:
+            if not self._hdc_mem or self._pixview is None:
+                raise RuntimeError("GDI capture is closed")
+            self._ensure_gdi()
+
+            rect = self.rect
+            h, w = self._pixview.shape[:2]
+            if not gdi32.BitBlt(self._hdc_mem, 0, 0, w, h, self._hdc_screen, rect.x, rect.y, SRCCOPY):
+                raise RuntimeError("BitBlt failed")
+
+            # GDI may batch the blit; make sure it landed before reading the bits.
+            gdi32.GdiFlush()
+            return self._pixview
+
+    def _iter_preprocess_variants(self, raw_bgra: np.ndarray, w: int, h: int):
+        # Last-known-good first, then its nearest neighbours in parameter space.
+        pre = _CropPreprocessor(raw_bgra, w, h)
+        for v in _variants_near(self._preferred_variant):
+            yield pre.run(v), v
+
+    def _software_bitmap_for(self, mono: np.ndarray, scale: int, slot: int) -> "SoftwareBitmap":
+        # GRAY8 moves a quarter of the bytes a BGRA8 bitmap would.
+        # Reuse a bitmap per (size, slot); safe because each slot has at most one
+        # recognize_async in flight, awaited before the bitmap is written again
+        # (a slot whose recognition is abandoned is evicted instead).
+        cache = self._sb_cache
+        if cache is None:
+            cache = self._sb_cache = {}
+        pw = mono.shape[1] * scale
+        ph = mono.shape[0] * scale
+        key = (pw, ph, slot)
+        sb = cache.get(key)
+        if sb is None:
+            if len(cache) >= _SB_CACHE_MAX:
+                cache.clear()
+            sb = SoftwareBitmap(BitmapPixelFormat.GRAY8, pw, ph, BitmapAlphaMode.IGNORE)
+            cache[key] = sb
+
+        writer = self._sb_writer
+        if writer is None:
+            try:
+                _write_software_bitmap(sb, mono, scale)
+                return sb
+            except TypeError:
+                # Older winrt wheels don't expose IMemoryBufferReference as a Python
+                # buffer: stage through one DataWriter (detach_buffer leaves it reusable).
+                writer = self._sb_writer = DataWriter()
+        writer.write_bytes(_upscale_nearest(mono, scale).tobytes())
+        sb.copy_from_buffer(writer.detach_buffer())
+        return sb
+
+    async def _ocr_once_locked(self, mono: np.ndarray, scale: int, slot: int = 0) -> tuple[str, Optional[int]]:
+        # OCRs `mono` upscaled by `scale`. Concurrent calls must pass distinct slots
+        # so they never share a bitmap.
+        sb = self._software_bitmap_for(mono, scale, slot)
 
         # If WinRT glitches here, let caller decide how to recover.
-        text = asyncio.run(_do_ocr())
+        assert self._engine is not None
+        if self._ocr_gray8_ok:
+            try:
+                result = await self._engine.recognize_async(sb)
+            except Exception:
+                # Recognizer may reject GRAY8 on some Windows builds: retry as BGRA8
+                # and, if that works, convert up front from now on.
+                result = await self._engine.recognize_async(SoftwareBitmap.convert(sb, BitmapPixelFormat.BGRA8))
+                self._ocr_gray8_ok = False
+        else:
+            result = await self._engine.recognize_async(SoftwareBitmap.convert(sb, BitmapPixelFormat.BGRA8))
+        text = (result.text or "").strip()
 
         with self._lock:
             self._last_ocr_text = text
 
-        m = _MMSS_RE.search(text.replace("\n", " "))
-        if not m:
-            return text, None
-
-        mm = int(m.group("mm"))
-        ss = int(m.group("ss"))
-        if 0 <= ss <= 59 and 0 <= mm <= 99:
-            return text, mm * 60 + ss
-        return text, None
+        return text, _parse_mmss(text)
 
     def _score_candidate(self, parsed_s: int, text: str, last_s: Optional[int]) -> int:
         score = 10_000
@@ -504,94 +805,172 @@ class ScreenClock:
         return score
 
     def _reset_engine_locked(self) -> None:
-        # Must be called under _ocr_lock.
+        # Must be called under _ocr_alock.
         if OcrEngine is None:
             return
         self._engine = OcrEngine.try_create_from_user_profile_languages()
+        self._sb_cache = {}
 
     def _worker(self) -> None:
         hr = ole32.CoInitializeEx(None, COINIT_APARTMENTTHREADED)
         com_ok = (hr == S_OK) or (hr == S_FALSE)
 
+        try:
+            # One event loop for the lifetime of the worker.
+            asyncio.run(self._worker_async())
+        finally:
+            if com_ok:
+                ole32.CoUninitialize()
+
+    async def _worker_async(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._ocr_alock = asyncio.Lock()
+
         try:
             period = 1.0 / max(1.0, float(self.poll_hz))
+            ok_gap = self.ocr_gap_after_ok_ticks / max(0.01, float(self.game_speed_multiplier))
             next_time = time.perf_counter()
 
             while not self._stop_evt.is_set():
                 now_m = time.perf_counter()
                 if now_m < next_time:
-                    time.sleep(min(0.01, next_time - now_m))
+                    await asyncio.sleep(next_time - now_m)
                     continue
                 next_time = now_m + period
 
                 try:
-                    t, used_variant = self._read_seconds_once_best()
+                    t, used_variant = await self._read_seconds_once_best()
                 except Exception:
                     # If we have been failing for a while, rebuild the engine to recover.
                     if (now_m - self._last_parse_ok_mono) > self.engine_reset_after_fail_s:
-                        with self._ocr_lock:
+                        async with self._ocr_alock:
                             self._reset_engine_locked()
                             self._last_parse_ok_mono = now_m
                     continue
 
                 if t is None:
                     if (now_m - self._last_parse_ok_mono) > self.engine_reset_after_fail_s:
-                        with self._ocr_lock:
+                        async with self._ocr_alock:
                             self._reset_engine_locked()
                             self._last_parse_ok_mono = now_m
                     continue
 
-                with self._lock:
-                    self._last_observed_s = t
-                    self._last_observed_wall_mono = time.perf_counter()
+                self._obs = (t, time.perf_counter_ns())
 
                 self._last_parse_ok_mono = now_m
                 if used_variant is not None:
                     self._preferred_variant = used_variant
+
+                # Failures keep the normal poll period (fast retry); only good reads back off.
+                next_time = max(next_time, now_m + ok_gap)
         finally:
-            if com_ok:
-                ole32.CoUninitialize()
+            self._loop = None
+            self._ocr_alock = None
 
-    def _read_seconds_once_best(self) -> tuple[Optional[int], Optional[Variant]]:
-        raw_full = _capture_bgra(self.rect)
-        raw, rw, rh, _used_local = _auto_crop_to_glyph_band(raw_full, self.rect.w, self.rect.h)
+    async def _read_seconds_once_best(self) -> tuple[Optional[int], Optional[Variant]]:
+        with self._gdi_lock:
+            raw_full = self._capture_bgra()
+            fh, fw = raw_full.shape[:2]
+            raw, rw, rh, _used_local = _auto_crop_to_glyph_band(raw_full, fw, fh)
 
-        with self._lock:
-            last_s = self._last_observed_s
+        # An identical glyph band OCRs to the same result; skip preprocess/OCR entirely.
+        # Hashing the band (not the frame) ignores noise in the HUD around the digits.
+        # Only successful parses are reused so a glitched engine still gets retried.
+        crop_key = (rw, rh, hashlib.blake2b(raw, digest_size=8).digest())
+        if crop_key == self._last_crop_key:
+            return self._last_crop_result
+
+        last_s = self._obs[0]
 
         best_score = -1
         best_parsed: Optional[int] = None
         best_text = ""
         best_variant: Optional[Variant] = None
 
-        # We derive the Variant from the tag format we emit.
-        def tag_to_variant(tag: str) -> Optional[Variant]:
-            m = re.match(r"s(\d+)_lum(\d+)_g(\d+)_d(\d+)", tag)
-            if not m:
-                return None
-            return (int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4)))
-
-        with self._ocr_lock:
-            for proc, pw, ph, tag in self._iter_preprocess_variants(raw, rw, rh):
-                text, parsed = self._ocr_once_locked(proc, pw, ph)
-                if parsed is None:
-                    if text:
-                        best_text = text
-                    continue
-
-                sc = self._score_candidate(parsed, text, last_s)
-                if sc > best_score:
-                    best_score = sc
-                    best_parsed = parsed
-                    best_text = text
-                    best_variant = tag_to_variant(tag)
+        assert self._ocr_alock is not None
+        async with self._ocr_alock:
+            variants = self._iter_preprocess_variants(raw, rw, rh)
+            # In-flight recognitions: task -> (search order, variant, bitmap slot).
+            pending: dict[asyncio.Task, tuple[int, Variant, int]] = {}
+            free_slots = list(range(_OCR_CONCURRENCY))
+            order = 0
+            # Finished recognitions are replayed strictly in search order, so the
+            # early stop, the winner and best_text are exactly the serial search's:
+            # a later variant finishing first has to wait for the earlier ones.
+            finished: dict[int, tuple[asyncio.Task, Variant]] = {}
+            replay = 0
+            stop = False
+            # The preferred variant runs alone first; in steady state it's all we need.
+            window = 1
+            try:
+                while True:
+                    while len(pending) < window:
+                        nxt = next(variants, None)
+                        if nxt is None:
+                            break
+                        mono, v = nxt
+                        slot = free_slots.pop()
+                        task = asyncio.ensure_future(self._ocr_once_locked(mono, v[0], slot))
+                        pending[task] = (order, v, slot)
+                        order += 1
+                    if not pending:
+                        break
 
-                # Very strong match: stop early.
-                if best_score >= 11_800:
-                    break
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    window = _OCR_CONCURRENCY
+                    for task in done:
+                        idx, v, slot = pending.pop(task)
+                        free_slots.append(slot)
+                        finished[idx] = (task, v)
+
+                    while replay in finished:
+                        task, v = finished.pop(replay)
+                        replay += 1
+                        text, parsed = task.result()
+                        if parsed is None:
+                            if text:
+                                best_text = text
+                            continue
+
+                        sc = self._score_candidate(parsed, text, last_s)
+                        if sc > best_score:
+                            best_score = sc
+                            best_parsed = parsed
+                            best_text = text
+                            best_variant = v
+
+                        # Very strong match (parsed within 9s of the last read): stop early.
+                        if best_score >= 11_800:
+                            stop = True
+                            break
+                    if stop:
+                        break
+            finally:
+                # Cancelling the task doesn't stop the native recognition, which may
+                # still be reading its slot's bitmap: evict those so the next search
+                # writes fresh ones instead of rewriting a bitmap that is in use.
+                cancelled_slots = {slot for _, _, slot in pending.values()}
+                if cancelled_slots and self._sb_cache:
+                    for key in [k for k in self._sb_cache if k[2] in cancelled_slots]:
+                        del self._sb_cache[key]
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+                # Finished but never replayed (the search stopped or raised first):
+                # retrieve their errors so asyncio doesn't log them as unretrieved.
+                for task, _ in finished.values():
+                    if not task.cancelled():
+                        task.exception()
 
         with self._lock:
             if best_text:
                 self._last_ocr_text = best_text
 
+        if best_parsed is not None:
+            self._last_crop_key = crop_key
+            self._last_crop_result = (best_parsed, best_variant)
+        else:
+            self._last_crop_key = None
+
         return best_parsed, best_variant
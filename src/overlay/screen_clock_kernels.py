@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+# Optional Numba kernel for the clock preprocess, imported lazily by screen_clock.
+# Only used when scipy is missing; importing this module fails without numba, and
+# screen_clock then uses its NumPy path. Serial on purpose: crops are tiny, and
+# numba's parallel runtime launched from the OCR worker thread hangs shutdown.
+#
+# There is deliberately no fused threshold + upscale kernel: _CropPreprocessor
+# thresholds each crop once for all variants, and the upscale writes straight into
+# the OCR bitmap (_write_software_bitmap), so fusing would redo the threshold per
+# variant and bring back the intermediate buffer it was meant to avoid.
+
+import numba  # type: ignore
+import numpy as np
+
+
+@numba.njit(cache=True, boundscheck=False)
+def dilate3x3(mask, iters):  # pragma: no cover
+    # 3x3 binary dilation with a zero border, ping-ponging between two buffers
+    # (neither of them `mask`, which is left untouched).
+    h, w = mask.shape
+    cur = mask.copy()
+    nxt = np.empty_like(mask)
+    for _ in range(iters):
+        for y in range(h):
+            y0 = max(0, y - 1)
+            y1 = min(h - 1, y + 1)
+            for x in range(w):
+                x0 = max(0, x - 1)
+                x1 = min(w - 1, x + 1)
+                v = 0
+                for yy in range(y0, y1 + 1):
+                    for xx in range(x0, x1 + 1):
+                        v |= cur[yy, xx]
+                nxt[y, x] = v
+        cur, nxt = nxt, cur
+    return cur
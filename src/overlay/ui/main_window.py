@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from bisect import bisect_right
+from functools import partial
 from typing import List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtGui import QColor, QPainter, QPaintEvent
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
-    QProgressBar,
     QVBoxLayout,
     QWidget,
 )
@@ -27,16 +29,75 @@ from overlay.missions import (
 from overlay.screen_clock import ScreenClock
 
 
+# Re-evaluating a property selector only needs polish(); the unpolish() half of
+# the usual idiom is redundant on Qt 6 and costs main-thread time on every flash
+# (Mixxx measured ~11% in a style-heavy widget). SC2_OVERLAY_UNPOLISH=1 restores it.
+_UNPOLISH = os.environ.get("SC2_OVERLAY_UNPOLISH") == "1"
+
+# Every MM:SS up to one hour, formatted once; later times fall back to formatting.
+_MMSS_TABLE: Tuple[str, ...] = tuple(f"{i // 60:02d}:{i % 60:02d}" for i in range(3601))
+
+
 def _fmt_mmss(t_s: Optional[int]) -> str:
     if t_s is None:
         return "--:--"
     t = max(0, int(t_s))
+    if t < len(_MMSS_TABLE):
+        return _MMSS_TABLE[t]
     return f"{t // 60:02d}:{t % 60:02d}"
 
 
-@dataclass(frozen=True)
 class EventSchedule:
-    events: Tuple[MissionEvent, ...]
+    """Time-sorted events for one module (see MissionDB), plus their times for bisect."""
+
+    __slots__ = ("events", "times")
+
+    def __init__(self, events: Tuple[MissionEvent, ...]) -> None:
+        self.events: Tuple[MissionEvent, ...] = events
+        self.times: Tuple[int, ...] = tuple(ev.time_s for ev in events)
+
+    def __repr__(self) -> str:
+        return f"EventSchedule(events={self.events!r})"
+
+
+class _FillBar(QWidget):
+    """
+    Neutral rounded fill bar, painted directly instead of through QProgressBar
+    and its QSS ::chunk rules. Repaints only when the filled width in pixels changes.
+    """
+
+    _TRACK = QColor(0, 0, 0, 18)
+    _CHUNK = QColor(0, 0, 0, 55)
+    _RADIUS = 4.0
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._permille = 0
+        self._fill_px = 0
+
+    def _fill_width(self) -> int:
+        return self._permille * self.width() // 1000
+
+    def set_permille(self, v: int) -> None:
+        self._permille = v
+        px = self._fill_width()
+        if px != self._fill_px:
+            self._fill_px = px
+            self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        self._fill_px = self._fill_width()
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        p.setPen(Qt.PenStyle.NoPen)
+        r = self.rect()
+        p.setBrush(self._TRACK)
+        p.drawRoundedRect(r, self._RADIUS, self._RADIUS)
+        if self._fill_px > 0:
+            r.setWidth(self._fill_px)
+            p.setBrush(self._CHUNK)
+            p.drawRoundedRect(r, self._RADIUS, self._RADIUS)
+        p.end()
 
 
 class TimerModule(QFrame):
@@ -50,33 +111,81 @@ class TimerModule(QFrame):
     - Flash state: ENTIRE module box flashes accent color
     """
 
-    _BAR_TRACK = "rgba(0, 0, 0, 18)"
-    _BAR_CHUNK = "rgba(0, 0, 0, 55)"
+    # Flash background per accent; modules pick one by name.
+    ACCENT_COLORS = {
+        "green": "rgba(0, 200, 80, 220)",
+        "orange": "rgba(255, 140, 0, 220)",
+        "red": "rgba(255, 40, 40, 220)",
+    }
+
+    @classmethod
+    def stylesheet(cls) -> str:
+        """
+        One stylesheet for every module, set once on a common ancestor.
+        Flash state is selected by the `flash` dynamic property, so toggling it
+        never re-parses QSS.
+        """
+        accents = "".join(
+            f"""
+            QFrame#timerModule[flash="true"][accent="{name}"] {{
+                background: {color};
+            }}
+            """
+            for name, color in cls.ACCENT_COLORS.items()
+        )
+        return (
+            """
+            QFrame#timerModule {
+                background: rgba(255, 255, 255, 170);
+                border: 1px solid rgba(0, 0, 0, 30);
+                border-radius: 8px;
+            }
+            QFrame#timerModule[flash="true"] {
+                border: 1px solid rgba(0, 0, 0, 55);
+            }
+            """
+            + accents
+            + """
+            QFrame#timerModule QLabel[role="icon"] { font-size: 16px; color: black; }
+            QFrame#timerModule QLabel[role="title"] { font-size: 12px; color: black; font-weight: 600; }
+            QFrame#timerModule QLabel[role="arrow"] { font-size: 14px; color: black; font-weight: 800; }
+            QFrame#timerModule QLabel[role="time"] { font-size: 12px; color: black; }
+            QFrame#timerModule[flash="true"] QLabel[role="icon"] { color: white; }
+            QFrame#timerModule[flash="true"] QLabel[role="title"] { color: white; font-weight: 700; }
+            QFrame#timerModule[flash="true"] QLabel[role="arrow"] { color: white; }
+            QFrame#timerModule[flash="true"] QLabel[role="time"] { color: white; font-weight: 700; }
+            """
+        )
 
-    def __init__(self, *, icon_text: str, title: str, flash_color: str) -> None:
+    def __init__(self, *, icon_text: str, title: str, accent: str) -> None:
         super().__init__()
-        self._flash_color = flash_color
+        # Python mirrors of what the widgets show, so setters skip Qt getters and
+        # unchanged values never reach Qt. The bar diffs its own pixel width.
         self._flash_on = False
+        self._time_text = "--:--"
+        self._arrow_text = ""
 
         self.setObjectName("timerModule")
+        self.setProperty("accent", accent)
+        self.setProperty("flash", False)
 
         self._icon = QLabel(icon_text)
         self._icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._icon.setFixedWidth(28)
+        self._icon.setProperty("role", "icon")
 
         self._title = QLabel(title)
+        self._title.setProperty("role", "title")
         self._time = QLabel("--:--")
+        self._time.setProperty("role", "time")
 
         self._arrow = QLabel("")
+        self._arrow.setProperty("role", "arrow")
         self._arrow.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._arrow.setFixedWidth(18)
 
-        self._bar = QProgressBar()
-        self._bar.setRange(0, 1000)
-        self._bar.setValue(0)
-        self._bar.setTextVisible(False)
+        self._bar = _FillBar()
         self._bar.setFixedHeight(8)
-        self._apply_bar_style()
 
         right_top = QHBoxLayout()
         right_top.setContentsMargins(0, 0, 0, 0)
@@ -98,66 +207,31 @@ class TimerModule(QFrame):
         root.addLayout(right, 1)
         self.setLayout(root)
 
-        self._apply_module_style(flash=False)
-
-    def _apply_bar_style(self) -> None:
-        self._bar.setStyleSheet(
-            f"""
-            QProgressBar {{
-                background: {self._BAR_TRACK};
-                border: none;
-                border-radius: 4px;
-            }}
-            QProgressBar::chunk {{
-                background: {self._BAR_CHUNK};
-                border-radius: 4px;
-            }}
-            """
-        )
-
     def _apply_module_style(self, *, flash: bool) -> None:
-        if flash:
-            self.setStyleSheet(
-                f"""
-                QFrame#timerModule {{
-                    background: {self._flash_color};
-                    border: 1px solid rgba(0, 0, 0, 55);
-                    border-radius: 8px;
-                }}
-                """
-            )
-            self._icon.setStyleSheet("font-size: 16px; color: white;")
-            self._title.setStyleSheet("font-size: 12px; color: white; font-weight: 700;")
-            self._arrow.setStyleSheet("font-size: 14px; color: white; font-weight: 800;")
-            self._time.setStyleSheet("font-size: 12px; color: white; font-weight: 700;")
-        else:
-            self.setStyleSheet(
-                """
-                QFrame#timerModule {
-                    background: rgba(255, 255, 255, 170);
-                    border: 1px solid rgba(0, 0, 0, 30);
-                    border-radius: 8px;
-                }
-                """
-            )
-            self._icon.setStyleSheet("font-size: 16px; color: black;")
-            self._title.setStyleSheet("font-size: 12px; color: black; font-weight: 600;")
-            self._arrow.setStyleSheet("font-size: 14px; color: black; font-weight: 800;")
-            self._time.setStyleSheet("font-size: 12px; color: black;")
+        self.setProperty("flash", flash)
+        # Property selectors are only re-evaluated on polish, and the labels
+        # match through a descendant selector, so each needs its own repolish.
+        for w in (self, self._icon, self._title, self._arrow, self._time):
+            if _UNPOLISH:
+                w.style().unpolish(w)
+            w.style().polish(w)
 
     def set_time_text(self, mmss: str) -> None:
-        if self._time.text() != mmss:
-            self._time.setText(mmss)
+        # Time strings come from _MMSS_TABLE / fixed literals, so an unchanged
+        # value is nearly always the very same object: test identity first.
+        if mmss is self._time_text or mmss == self._time_text:
+            return
+        self._time_text = mmss
+        self._time.setText(mmss)
 
     def set_arrow_text(self, arrow: str) -> None:
-        if self._arrow.text() != arrow:
+        if arrow != self._arrow_text:
+            self._arrow_text = arrow
             self._arrow.setText(arrow)
 
     def set_progress_ratio(self, ratio_0_to_1: float) -> None:
         r = max(0.0, min(1.0, float(ratio_0_to_1)))
-        v = int(r * 1000)
-        if self._bar.value() != v:
-            self._bar.setValue(v)
+        self._bar.set_permille(int(r * 1000))
 
     def set_flash(self, on: bool) -> None:
         on = bool(on)
@@ -167,6 +241,12 @@ class TimerModule(QFrame):
         self._apply_module_style(flash=on)
 
 
+# (time text, arrow, fill ratio, flash) as shown by one TimerModule.
+_ModuleState = Tuple[str, str, float, bool]
+_EMPTY_STATE: _ModuleState = ("--:--", "", 0.0, False)
+_DONE_STATE: _ModuleState = ("00:00", "", 0.0, False)
+
+
 class ScheduledModule:
     """
     Non-cyclic schedule logic.
@@ -175,51 +255,66 @@ class ScheduledModule:
 
     def __init__(self, ui: TimerModule, schedule: EventSchedule, *, flash_pre_s: int = 10, flash_post_s: int = 5):
         self.ui = ui
-        self.schedule = schedule
         self.flash_pre_s = int(flash_pre_s)
         self.flash_post_s = int(flash_post_s)
 
+        # Last input, so an unchanged game second skips the recompute. Holds a
+        # value compute() can never receive until the first call. Unchanged
+        # fields are filtered by the TimerModule setters.
+        self._last_t: object = object()
+
+        self.set_schedule(schedule)
+
+    def set_schedule(self, schedule: EventSchedule) -> None:
+        self.schedule = schedule
+        self._events = schedule.events
+        self._times = schedule.times
+
+        # Flash windows [time - pre, time + post] per event. Pre/post are shared, so
+        # starts and ends are both sorted and the last window starting at or
+        # before t is the only one that can still contain it.
+        self._flash_starts = tuple(ts - self.flash_pre_s for ts in self._times)
+        self._flash_ends = tuple(ts + self.flash_post_s for ts in self._times)
+
+        # The next compute() recomputes even if the game second is unchanged.
+        self._last_t = object()
+
     def _prev_next(self, t_s: int) -> Tuple[Optional[MissionEvent], Optional[MissionEvent]]:
-        prev_ev: Optional[MissionEvent] = None
-        next_ev: Optional[MissionEvent] = None
-        for ev in self.schedule.events:
-            if ev.time_s <= t_s:
-                prev_ev = ev
-            if ev.time_s > t_s:
-                next_ev = ev
-                break
+        # Last event at or before t_s, first event strictly after it.
+        events = self._events
+        i = bisect_right(self._times, t_s)
+        prev_ev = events[i - 1] if i > 0 else None
+        next_ev = events[i] if i < len(events) else None
         return prev_ev, next_ev
 
-    def update(self, t_s: Optional[int]) -> None:
-        if t_s is None:
-            self.ui.set_time_text("--:--")
-            self.ui.set_arrow_text("")
-            self.ui.set_progress_ratio(0.0)
-            self.ui.set_flash(False)
-            return
-
-        t = int(t_s)
-        prev_ev, next_ev = self._prev_next(t)
+    def apply(self, state: _ModuleState) -> None:
+        text, arrow, ratio, flash = state
+        ui = self.ui
+        ui.set_time_text(text)
+        ui.set_arrow_text(arrow)
+        ui.set_progress_ratio(ratio)
+        ui.set_flash(flash)
+
+    def compute(self, t_s: Optional[int]) -> Optional[_ModuleState]:
+        # Returns what the module should show, or None if t_s is unchanged. Touches no widgets,
+        # but records t_s as seen: a repeat call with the same t_s returns None.
+        t = None if t_s is None else int(t_s)
+        if t == self._last_t:
+            return None
+        self._last_t = t
+
+        if t is None:
+            return _EMPTY_STATE
 
         # No events configured at all for this module
         if not self.schedule.events:
-            self.ui.set_time_text("--:--")
-            self.ui.set_arrow_text("")
-            self.ui.set_progress_ratio(0.0)
-            self.ui.set_flash(False)
-            return
+            return _EMPTY_STATE
+
+        prev_ev, next_ev = self._prev_next(t)
 
         if next_ev is None:
             # Past the last scheduled event: stay reset and show 00:00 (not --:--)
-            self.ui.set_time_text("00:00")
-            self.ui.set_arrow_text("")
-            self.ui.set_progress_ratio(0.0)
-            self.ui.set_flash(False)
-            return
-
-        # Countdown to next event
-        self.ui.set_time_text(_fmt_mmss(max(0, next_ev.time_s - t)))
-        self.ui.set_arrow_text(next_ev.arrow or "")
+            return _DONE_STATE
 
         # Fill between prev and next (prev defaults to 0)
         start = 0 if prev_ev is None else prev_ev.time_s
@@ -227,21 +322,13 @@ class ScheduledModule:
 
         span = max(1, end - start)
         elapsed = max(0, min(span, t - start))
-        self.ui.set_progress_ratio(elapsed / span)
-
-        # Flash: within [-pre, +post] of prev or next
-        flash = False
-        pre = self.flash_pre_s
-        post = self.flash_post_s
 
-        for ev in (prev_ev, next_ev):
-            if ev is None:
-                continue
-            if (t >= ev.time_s - pre) and (t <= ev.time_s + post):
-                flash = True
-                break
+        # Flash: within [-pre, +post] of any event (only prev or next can qualify)
+        i = bisect_right(self._flash_starts, t) - 1
+        flash = i >= 0 and t <= self._flash_ends[i]
 
-        self.ui.set_flash(flash)
+        # Countdown to next event
+        return _fmt_mmss(max(0, next_ev.time_s - t)), next_ev.arrow or "", elapsed / span, flash
 
 
 def _load_mission_db_or_default() -> MissionDB:
@@ -255,7 +342,97 @@ def _pick_mission(db: MissionDB) -> Mission:
     return db.get("cradle_of_death")
 
 
+class _MissionLoaderSignals(QObject):
+    loaded = Signal(object)  # Mission
+    failed = Signal(str)
+
+
+class _MissionLoader(QRunnable):
+    """Loads the MissionDB and picks the mission on a QThreadPool thread."""
+
+    def __init__(self, signals: _MissionLoaderSignals) -> None:
+        super().__init__()
+        # Owned by the GUI thread, so the emits below are queued onto it.
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            mission = _pick_mission(_load_mission_db_or_default())
+        except Exception as e:
+            self._signals.failed.emit(f"{type(e).__name__}: {e}")
+            return
+        self._signals.loaded.emit(mission)
+
+
+class ClockTicker(QObject):
+    """
+    Push-style view of ScreenClock.display_time() for the GUI thread:
+    - A single-shot timer wakes just after each game-second boundary
+      (~0.71 s at 1.4x, from ScreenClock.ns_until_next_tick)
+    - Never sleeps longer than _MAX_MS, so OCR corrections and --:-- show promptly
+    - mmss_changed(t_game_s, mmss) fires only when the shown MM:SS changes
+    """
+
+    mmss_changed = Signal(object, str)  # (Optional[int], str)
+
+    _MAX_MS = 500
+    _SLACK_MS = 5
+
+    def __init__(self, clock: ScreenClock, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._clock = clock
+        self._last_mmss = ""
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._poll)
+
+    def start(self) -> None:
+        self._poll()
+
+    def refresh(self) -> None:
+        # Report the current time even if MM:SS has not changed (e.g. new schedules).
+        self._last_mmss = ""
+        self._poll()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    @Slot()
+    def _poll(self) -> None:
+        t_game_s, mmss = self._clock.display_time()
+        # Re-arm before emitting so a failing handler cannot stop the clock.
+        self._timer.start(self._next_ms())
+        if mmss != self._last_mmss:
+            self._last_mmss = mmss
+            self.mmss_changed.emit(t_game_s, mmss)
+
+    def _next_ms(self) -> int:
+        ns = self._clock.ns_until_next_tick()
+        # A deadline already due means display_time() did not advance it: nothing
+        # will change on its own, so fall back to the slow poll.
+        if ns is None or ns <= 0:
+            return self._MAX_MS
+        return max(1, min(self._MAX_MS, ns // 1_000_000 + self._SLACK_MS))
+
+
+# (icon, title, accent, column, event type), in column order.
+# MainWindow builds one TimerModule + ScheduledModule per row.
+_MODULE_SPECS: Tuple[Tuple[str, str, str, int, str], ...] = (
+    ("🚩", "Main Objective", "green", 0, EVENT_MAIN_OBJECTIVE),
+    ("🏁", "Bonus Objective", "green", 0, EVENT_BONUS_OBJECTIVE),
+    ("🛡️⚔️", "Escort Wave", "orange", 1, EVENT_ESCORT),
+    ("⚔️", "Attack Wave", "red", 2, EVENT_ATTACK),
+    ("🌀", "Warp-in", "red", 2, EVENT_WARP_IN),
+    ("☄️", "Drop Pods", "red", 2, EVENT_DROP_PODS),
+)
+_MODULE_COLUMNS = 3
+
+
 class MainWindow(QWidget):
+    _LOADING_TEXT = "Loading mission data..."
+
     def __init__(self, clock: ScreenClock) -> None:
         super().__init__()
         self._clock = clock
@@ -277,6 +454,7 @@ class MainWindow(QWidget):
                 border-radius: 10px;
             }
             """
+            + TimerModule.stylesheet()
         )
 
         self._label_time = QLabel("Game Time: --:--")
@@ -287,48 +465,38 @@ class MainWindow(QWidget):
         self._label_instr.setStyleSheet("font-size: 11px; color: black;")
         self._label_instr.setVisible(False)
 
-        self._instr_hide_timer = QTimer(self)
-        self._instr_hide_timer.setSingleShot(True)
-        self._instr_hide_timer.timeout.connect(lambda: self._label_instr.setVisible(False))
-
-        flash_green = "rgba(0, 200, 80, 220)"
-        flash_orange = "rgba(255, 140, 0, 220)"
-        flash_red = "rgba(255, 40, 40, 220)"
-
-        self._mod_obj_main = TimerModule(icon_text="🚩", title="Main Objective", flash_color=flash_green)
-        self._mod_obj_bonus = TimerModule(icon_text="🏁", title="Bonus Objective", flash_color=flash_green)
-        self._mod_escort = TimerModule(icon_text="🛡️⚔️", title="Escort Wave", flash_color=flash_orange)
-        self._mod_attack = TimerModule(icon_text="⚔️", title="Attack Wave", flash_color=flash_red)
-        self._mod_warp = TimerModule(icon_text="🌀", title="Warp-in", flash_color=flash_red)
-        self._mod_drop = TimerModule(icon_text="☄️", title="Drop Pods", flash_color=flash_red)
-
-        col_obj = QVBoxLayout()
-        col_obj.setContentsMargins(0, 0, 0, 0)
-        col_obj.setSpacing(6)
-        col_obj.addWidget(self._mod_obj_main)
-        col_obj.addWidget(self._mod_obj_bonus)
-        col_obj.addStretch(1)
-
-        col_escort = QVBoxLayout()
-        col_escort.setContentsMargins(0, 0, 0, 0)
-        col_escort.setSpacing(6)
-        col_escort.addWidget(self._mod_escort)
-        col_escort.addStretch(1)
-
-        col_attacks = QVBoxLayout()
-        col_attacks.setContentsMargins(0, 0, 0, 0)
-        col_attacks.setSpacing(6)
-        col_attacks.addWidget(self._mod_attack)
-        col_attacks.addWidget(self._mod_warp)
-        col_attacks.addWidget(self._mod_drop)
-        col_attacks.addStretch(1)
+        # Mirrors of _label_instr's text and visibility, so repeats skip Qt entirely.
+        self._last_instr: str = ""
+        self._instr_visible = False
+        # Bumped by every set_debug_text; a pending auto-hide only fires if it
+        # still holds the current token, which is how newer text cancels it.
+        self._instr_token = 0
+
+        # Modules start with empty schedules (showing --:--) and get the real ones
+        # once the mission data has loaded off the GUI thread.
+        empty = EventSchedule(events=())
+        columns = []
+        for _ in range(_MODULE_COLUMNS):
+            col = QVBoxLayout()
+            col.setContentsMargins(0, 0, 0, 0)
+            col.setSpacing(6)
+            columns.append(col)
+
+        self._logic_modules: List[ScheduledModule] = []
+        event_types: List[str] = []  # event type shown by each entry of _logic_modules
+        for icon, title, accent, column, event_type in _MODULE_SPECS:
+            mod = TimerModule(icon_text=icon, title=title, accent=accent)
+            columns[column].addWidget(mod)
+            self._logic_modules.append(ScheduledModule(mod, empty, flash_pre_s=10, flash_post_s=5))
+            event_types.append(event_type)
+        self._logic_event_types = tuple(event_types)
 
         modules_row = QHBoxLayout()
         modules_row.setContentsMargins(0, 0, 0, 0)
         modules_row.setSpacing(8)
-        modules_row.addLayout(col_obj, 1)
-        modules_row.addLayout(col_escort, 1)
-        modules_row.addLayout(col_attacks, 1)
+        for col in columns:
+            col.addStretch(1)
+            modules_row.addLayout(col, 1)
 
         panel_layout = QVBoxLayout()
         panel_layout.setContentsMargins(12, 12, 12, 12)
@@ -343,54 +511,68 @@ class MainWindow(QWidget):
         root.addWidget(panel)
         self.setLayout(root)
 
-        db = _load_mission_db_or_default()
-        mission = _pick_mission(db)
-
-        self._sched_obj_main = EventSchedule(events=mission.events_of_type(EVENT_MAIN_OBJECTIVE))
-        self._sched_obj_bonus = EventSchedule(events=mission.events_of_type(EVENT_BONUS_OBJECTIVE))
-        self._sched_escort = EventSchedule(events=mission.events_of_type(EVENT_ESCORT))
-        self._sched_attack = EventSchedule(events=mission.events_of_type(EVENT_ATTACK))
-        self._sched_warp = EventSchedule(events=mission.events_of_type(EVENT_WARP_IN))
-        self._sched_drop = EventSchedule(events=mission.events_of_type(EVENT_DROP_PODS))
-
-        self._logic_modules: List[ScheduledModule] = [
-            ScheduledModule(self._mod_obj_main, self._sched_obj_main, flash_pre_s=10, flash_post_s=5),
-            ScheduledModule(self._mod_obj_bonus, self._sched_obj_bonus, flash_pre_s=10, flash_post_s=5),
-            ScheduledModule(self._mod_escort, self._sched_escort, flash_pre_s=10, flash_post_s=5),
-            ScheduledModule(self._mod_attack, self._sched_attack, flash_pre_s=10, flash_post_s=5),
-            ScheduledModule(self._mod_warp, self._sched_warp, flash_pre_s=10, flash_post_s=5),
-            ScheduledModule(self._mod_drop, self._sched_drop, flash_pre_s=10, flash_post_s=5),
-        ]
-
-        self._last_mmss: str = ""
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._tick)
-        self._timer.start(50)
-
-        self._tick()
-
-    def _tick(self) -> None:
-        t_game_s, mmss = self._clock.display_time()
-
-        if mmss == self._last_mmss:
-            return
-        self._last_mmss = mmss
-
+        self._ticker = ClockTicker(clock, self)
+        self._ticker.mmss_changed.connect(self._on_mmss)
+        self._ticker.start()
+
+        self._show_instr(self._LOADING_TEXT, hide_after_ms=None)
+        self._mission_signals = _MissionLoaderSignals(self)
+        self._mission_signals.loaded.connect(self._on_mission_loaded)
+        self._mission_signals.failed.connect(self._on_mission_failed)
+        QThreadPool.globalInstance().start(_MissionLoader(self._mission_signals))
+
+    @Slot(object, str)
+    def _on_mmss(self, t_game_s: Optional[int], mmss: str) -> None:
+        # Work out every module's state first, then push all widget changes in one
+        # pass. Qt already coalesces the resulting update() calls into a single
+        # paint of just the dirty widgets; a setUpdatesEnabled(False/True)
+        # bracket would instead repaint the whole panel (~4x the area) each time.
+        states = [lm.compute(t_game_s) for lm in self._logic_modules]
         self._label_time.setText(f"Game Time: {mmss}")
+        for lm, state in zip(self._logic_modules, states):
+            if state is not None:
+                lm.apply(state)
+
+    @Slot(object)
+    def _on_mission_loaded(self, mission: Mission) -> None:
+        for lm, event_type in zip(self._logic_modules, self._logic_event_types):
+            lm.set_schedule(EventSchedule(events=mission.events_of_type(event_type)))
+        self._ticker.refresh()
+        if self._last_instr == self._LOADING_TEXT:
+            self._show_instr("", hide_after_ms=None)
+
+    @Slot(str)
+    def _on_mission_failed(self, err: str) -> None:
+        msg = f"Mission data failed to load ({err})."
+        print(f"ERROR: {msg}", flush=True)
+        self._show_instr(msg, hide_after_ms=None)
+
+    @Slot()
+    def _hide_instr(self) -> None:
+        if self._instr_visible:
+            self._instr_visible = False
+            self._label_instr.setVisible(False)
 
-        for lm in self._logic_modules:
-            lm.update(t_game_s)
+    def _expire_instr(self, token: int) -> None:
+        if token == self._instr_token:
+            self._hide_instr()
 
     def set_debug_text(self, text: str) -> None:
+        self._show_instr(text, hide_after_ms=None if text.startswith("CALIBRATE:") else 2000)
+
+    def _show_instr(self, text: str, *, hide_after_ms: Optional[int]) -> None:
+        self._instr_token += 1
         if not text:
-            self._label_instr.setVisible(False)
+            self._hide_instr()
             return
 
-        self._label_instr.setText(text)
-        self._label_instr.setVisible(True)
-
-        if text.startswith("CALIBRATE:"):
-            self._instr_hide_timer.stop()
-            return
+        # Repeats of the visible text only extend how long it stays up.
+        if text != self._last_instr:
+            self._last_instr = text
+            self._label_instr.setText(text)
+        if not self._instr_visible:
+            self._instr_visible = True
+            self._label_instr.setVisible(True)
 
-        self._instr_hide_timer.start(2000)
+        if hide_after_ms is not None:
+            QTimer.singleShot(hide_after_ms, self, partial(self._expire_instr, self._instr_token))